@@ -1,9 +1,13 @@
+import asyncio
 import json
+import re
+from collections import defaultdict, deque, namedtuple
 from dataclasses import dataclass
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Iterator, Set, Optional, Tuple
 from enum import Enum
-from contextlib import contextmanager
-from openai import OpenAI
+from functools import lru_cache
+from contextlib import closing, contextmanager
+from openai import AsyncOpenAI, OpenAI
 
 
 
@@ -20,6 +24,36 @@ class ValidationError(Exception):
     pass
 
 
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _edit_distance(a: str, b: str, bound: Optional[int] = None) -> int:
+    """计算编辑距离；给定 bound 时，一旦超出即提前返回 bound + 1"""
+    if bound is None:
+        bound = max(len(a), len(b))
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+
+    # 单行 Wagner-Fischer：row[j] 为 a[:i] 与 b[:j] 的距离
+    row = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        diagonal, row[0] = row[0], i
+        for j, char_b in enumerate(b, 1):
+            diagonal, row[j] = row[j], min(
+                row[j] + 1,
+                row[j - 1] + 1,
+                diagonal + (char_a != char_b)
+            )
+        if min(row) > bound:
+            return bound + 1
+    return min(row[-1], bound + 1)
+
+
+# 课程信息：tags 保持原有顺序用于展示，tag_set 用于求交集，name_lower 用于模糊匹配
+Course = namedtuple("Course", ["type", "tags", "tag_set", "name_lower"])
+
+
 # 枚举操作类型
 class Action(Enum):
     QUERY = "query"
@@ -31,39 +65,112 @@ class Action(Enum):
 
 class ConversationManager:
     def __init__(self, max_history: int = 3):
-        self.history = []
+        # 定长队列，超出 max_history 时自动丢弃最早的消息
+        self.history = deque(maxlen=max_history)
         self.max_history = max_history
+        # 拼接好的历史文本，新增消息时失效
+        self._history_text: Optional[str] = None
 
     def add_message(self, role: str, content: str):
-        self.history.append({"role": role, "content": content})
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        self.history.append({
+            "role": role,
+            "label": "学生" if role == "user" else "助手",
+            "content": content
+        })
+        self._history_text = None
 
     def get_recent_history(self) -> str:
-        return "\n".join(
-            f"{'学生' if msg['role'] == 'user' else '助手'}: {msg['content']}"
-            for msg in self.history
-        )
+        if self._history_text is None:
+            self._history_text = "\n".join(
+                f"{msg['label']}: {msg['content']}"
+                for msg in self.history
+            )
+        return self._history_text
+
+
+# 相同 api_key/base_url 共享同一个 SDK 客户端，复用其连接池
+@lru_cache(maxsize=None)
+def _shared_client(api_key: str, base_url: str) -> OpenAI:
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@lru_cache(maxsize=None)
+def _shared_async_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=api_key, base_url=base_url)
 
 
 class OpenAIClient:
-    def __init__(self, api_key: str, base_url: str):
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+    def __init__(self, api_key: str, base_url: str, concurrency: int = 4,
+                 client: Optional[OpenAI] = None, async_client: Optional[AsyncOpenAI] = None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.client = client or _shared_client(api_key, base_url)
+        self._async_client = async_client
+        self.concurrency = concurrency
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        # 仅在首次异步调用时创建，纯同步使用时不建立额外的连接池
+        if self._async_client is None:
+            self._async_client = _shared_async_client(self.api_key, self.base_url)
+        return self._async_client
+
+    @async_client.setter
+    def async_client(self, value: AsyncOpenAI):
+        self._async_client = value
+
+    def _request_params(self, prompt: str) -> dict:
+        # JSON 模式由服务端保证输出合法 JSON，避免代码块包裹等导致解析失败
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"}
+        }
 
     def get_completion(self, prompt: str) -> str:
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = self.client.chat.completions.create(**self._request_params(prompt))
             return response.choices[0].message.content
         except Exception as e:
             raise APIError(f"API调用失败: {str(e)}")
 
+    def stream_completion(self, prompt: str) -> Iterator[str]:
+        """流式请求，逐个返回模型输出的文本片段；提前关闭生成器会同时关闭连接"""
+        try:
+            stream = self.client.chat.completions.create(stream=True, **self._request_params(prompt))
+        except Exception as e:
+            raise APIError(f"API调用失败: {str(e)}")
+
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise APIError(f"API调用失败: {str(e)}")
+        finally:
+            stream.close()
+
+    async def aget_completion(self, prompt: str) -> str:
+        try:
+            response = await self.async_client.chat.completions.create(**self._request_params(prompt))
+            return response.choices[0].message.content
+        except Exception as e:
+            raise APIError(f"API调用失败: {str(e)}")
+
+    async def aget_completions(self, prompts: List[str]) -> List[str]:
+        """并发请求多个提示，同时进行的请求数不超过 concurrency，结果按输入顺序返回"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def limited(prompt: str) -> str:
+            async with semaphore:
+                return await self.aget_completion(prompt)
+
+        return list(await asyncio.gather(*(limited(prompt) for prompt in prompts)))
+
 
 class CourseSystem:
     def __init__(self):
-        self.courses = {
+        course_table = {
             "高等数学": {"type": "必修", "tags": ["理科", "基础课"]},
             "线性代数": {"type": "必修", "tags": ["理科", "基础课"]},
             "数据结构与算法": {"type": "必修", "tags": ["编程", "专业核心"]},
@@ -96,7 +203,37 @@ class CourseSystem:
             "云计算安全": {"type": "选修", "tags": ["专业方向", "云计算", "安全"]},
             "体育": {"type": "选修", "tags": ["运动"]}
         }
+        self.courses: Dict[str, Course] = {
+            name: Course(info["type"], tuple(info["tags"]), frozenset(info["tags"]), name.lower())
+            for name, info in course_table.items()
+        }
         self.selected_courses = set()
+        # 课程表是静态的，压缩为“课程名|类型|标签”行供每轮提示词复用，减少输入 token；若修改 courses 需重新赋值
+        self._courses_compact = "\n".join(
+            f"{name}|{info.type}|{'/'.join(info.tags)}"
+            for name, info in self.courses.items()
+        )
+        # 课程类型 -> 课程名列表（保持课程表顺序），供按类型筛选
+        self._by_type: Dict[str, List[str]] = defaultdict(list)
+        for name, info in self.courses.items():
+            self._by_type[info.type].append(name)
+        # 预处理课程名的 bigram 倒排索引，供模糊匹配快速筛选候选
+        self._course_order = {name: i for i, name in enumerate(self.courses)}
+        self._bigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._char_index: Dict[str, Set[str]] = defaultdict(set)
+        self._short_courses = set()
+        for name, info in self.courses.items():
+            name_lower = info.name_lower
+            for char in name_lower:
+                self._char_index[char].add(name)
+            if len(name_lower) < 2:
+                self._short_courses.add(name)
+            for bigram in _bigrams(name_lower):
+                self._bigram_index[bigram].add(name)
+        # 已选课程的小写名 -> 课程名，随 selected_courses 同步维护
+        self._selected_lower: Dict[str, str] = {}
+        self._selected_version = 0
+        self._cached_similar = lru_cache(maxsize=256)(self._search_similar_courses)
         self.conversation_manager = ConversationManager()
         self.last_mentioned_course = None
         self.ai_client = OpenAIClient(
@@ -112,6 +249,8 @@ class CourseSystem:
             print(f"课程操作错误: {str(e)}")
         except APIError as e:
             print(f"API错误: {str(e)}")
+        except ValidationError as e:
+            print(f"输入错误: {str(e)}")
         except Exception as e:
             print(f"系统错误: {str(e)}")
 
@@ -126,20 +265,76 @@ class CourseSystem:
         if course_name in courses:
             return [course_name]
 
-        similar_courses = []
+        # 已选课程变化时版本号递增，使缓存的旧结果失效
+        version = self._selected_version if selected else 0
+        return list(self._cached_similar(course_name, selected, version))
+
+    def _search_similar_courses(self, course_name: str, selected: bool, version: int) -> Tuple[str, ...]:
+        """模糊匹配的实际实现，由 lru_cache 包装；version 仅作为缓存键"""
         search_term = course_name.lower()
+        keywords = search_term.split()
+        # 关键词较多时合并为一个正则，每门课程只需扫描一次
+        keyword_pattern = re.compile("|".join(map(re.escape, keywords))) if len(keywords) >= 3 else None
+
+        # 待匹配的 (课程名, 小写课程名) 列表
+        if selected:
+            # 已选课程通常只有几门，直接遍历其小写映射，无需查倒排索引
+            all_courses = sorted(
+                ((name, name_lower) for name_lower, name in self._selected_lower.items()),
+                key=lambda item: self._course_order[item[0]]
+            )
+            courses = all_courses
+        else:
+            all_courses = ((name, info.name_lower) for name, info in self.courses.items())
+            candidates = self._find_candidates(search_term, keywords)
+            courses = [(course, self.courses[course].name_lower)
+                       for course in sorted(candidates, key=self._course_order.get)]
 
         # 模糊匹配
-        for course in courses:
-            course_lower = course.lower()
+        similar_courses = []
+        for course, course_lower in courses:
             # 包含关系
             if search_term in course_lower or course_lower in search_term:
                 similar_courses.append(course)
             # 关键词匹配
-            elif any(keyword in course_lower for keyword in search_term.split()):
+            elif (keyword_pattern.search(course_lower) if keyword_pattern
+                  else any(keyword in course_lower for keyword in keywords)):
                 similar_courses.append(course)
 
-        return similar_courses
+        # 容错匹配：无包含关系时，接受编辑距离足够小的课程（如错别字）
+        if not similar_courses:
+            for course, course_lower in all_courses:
+                bound = max(1, min(len(search_term), len(course_lower)) // 8)
+                if _edit_distance(search_term, course_lower, bound) <= bound:
+                    similar_courses.append(course)
+
+        # 按编辑距离排序，距离相同时保持课程表顺序
+        similar_courses.sort(key=lambda course: _edit_distance(search_term, self.courses[course].name_lower))
+        return tuple(similar_courses)
+
+    def _find_candidates(self, search_term: str, keywords: List[str]) -> Set[str]:
+        """通过倒排索引筛选可能匹配的课程，结果是真实匹配的超集"""
+        if not search_term:
+            return set(self.courses)
+
+        candidates = set(self._short_courses)
+        for bigram in _bigrams(search_term):
+            candidates.update(self._bigram_index.get(bigram, ()))
+        # 单字关键词无法通过 bigram 命中，按单字索引补充
+        for keyword in keywords + [search_term]:
+            if len(keyword) == 1:
+                candidates.update(self._char_index.get(keyword, ()))
+        return candidates
+
+    def _add_selected(self, course_name: str):
+        self.selected_courses.add(course_name)
+        self._selected_lower[self.courses[course_name].name_lower] = course_name
+        self._selected_version += 1
+
+    def _remove_selected(self, course_name: str):
+        self.selected_courses.remove(course_name)
+        del self._selected_lower[self.courses[course_name].name_lower]
+        self._selected_version += 1
 
     def select_course(self, course_name: str, force: bool = False) -> dict:
         """选择课程，返回结果字典"""
@@ -156,11 +351,18 @@ class CourseSystem:
             if course_name in self.selected_courses:
                 result["message"] = f"您已经选择了 {course_name}"
             else:
-                self.selected_courses.add(course_name)
+                self._add_selected(course_name)
                 result["success"] = True
                 result["message"] = f"成功选择 {course_name}"
             return result
 
+        # 课程名完全匹配时直接请求确认，无需模糊查找
+        if course_name in self.courses:
+            result["needs_confirmation"] = True
+            result["course_to_confirm"] = course_name
+            result["message"] = f"您是否想选择 '{course_name}' ？"
+            return result
+
         # 查找相似课程
         similar_courses = self.find_similar_courses(course_name)
 
@@ -192,7 +394,7 @@ class CourseSystem:
 
         # 如果是强制退选模式，直接尝试退选
         if force and course_name in self.selected_courses:
-            self.selected_courses.remove(course_name)
+            self._remove_selected(course_name)
             result["success"] = True
             result["message"] = f"成功退选 {course_name}"
             return result
@@ -223,24 +425,41 @@ class CourseSystem:
                             "\n".join(f"{i + 1}. {c}" for i, c in enumerate(similar_courses))
         return result
 
-    def validate_course_name(self, course_name: str) -> bool:
-        if not course_name or not isinstance(course_name, str):
+    def _validate_strict(self, course_name: str):
+        """在使用模型返回的课程名之前检查其类型，之后的调用可直接视为字符串"""
+        if not isinstance(course_name, str) or len(course_name) == 0:
             raise ValidationError("课程名称无效")
+
+    def validate_course_name(self, course_name: str) -> bool:
         return course_name in self.courses
 
     def query_courses(self, filters: List[str] = None, interests: List[str] = None) -> List[dict]:
+        if filters and (isinstance(filters, str) or not all(isinstance(f, str) for f in filters)):
+            # 模型可能返回字符串或非字符串元素，无法查索引，退回逐门比较
+            course_names = [name for name, info in self.courses.items() if info.type in filters]
+        elif filters:
+            # 只遍历符合类型的课程，重复的类型只算一次
+            course_types = dict.fromkeys(filters)
+            course_names = [name for course_type in course_types
+                            for name in self._by_type.get(course_type, ())]
+            if len(course_types) > 1:
+                course_names.sort(key=self._course_order.get)
+        else:
+            course_names = self.courses
+
         results = []
-        for course_name, info in self.courses.items():
-            if not filters or info["type"] in filters:
-                results.append({
-                    "name": course_name,
-                    "type": info["type"],
-                    "tags": info["tags"]
-                })
+        for course_name in course_names:
+            info = self.courses[course_name]
+            results.append({
+                "name": course_name,
+                "type": info.type,
+                "tags": list(info.tags)
+            })
 
         if interests:
+            interest_set = frozenset(interests)
             results.sort(
-                key=lambda x: len(set(self.courses[x["name"]]["tags"]) & set(interests)),
+                key=lambda x: len(self.courses[x["name"]].tag_set & interest_set),
                 reverse=True
             )
 
@@ -253,8 +472,8 @@ class CourseSystem:
         return [
             {
                 "name": course,
-                "type": self.courses[course]["type"],
-                "tags": self.courses[course]["tags"]
+                "type": self.courses[course].type,
+                "tags": list(self.courses[course].tags)
             }
             for course in self.selected_courses
         ]
@@ -267,29 +486,44 @@ class CourseSystem:
         prompt = self._build_prompt(user_input)
 
         try:
-            response = self.ai_client.get_completion(prompt)
-            parsed_response = json.loads(response)
+            parsed_response = self._stream_json(prompt)
 
             self.conversation_manager.add_message(
                 "assistant",
                 parsed_response["context"]["message"]
             )
 
-            if parsed_response.get("course_name"):
-                self.last_mentioned_course = parsed_response["course_name"]
+            # 课程名仅在选课/退课时校验；其他动作下无效的课程名直接忽略
+            course_name = parsed_response.get("course_name")
+            if isinstance(course_name, str) and course_name:
+                self.last_mentioned_course = course_name
 
             return parsed_response
 
         except json.JSONDecodeError:
             raise APIError("无法解析API响应")
 
+    def _stream_json(self, prompt: str) -> dict:
+        """流式接收模型输出，JSON 一旦完整即解析返回，不必等待响应结束"""
+        buffer = ""
+        with closing(self.ai_client.stream_completion(prompt)) as chunks:
+            for chunk in chunks:
+                buffer += chunk
+                # 只有收到右花括号时 JSON 才可能完整，避免对每个片段都尝试解析
+                if "}" in chunk:
+                    try:
+                        return json.loads(buffer)
+                    except json.JSONDecodeError:
+                        continue
+        return json.loads(buffer)
+
     def _build_prompt(self, user_input: str) -> str:
         conversation = self.conversation_manager.get_recent_history()
 
         return f"""你是一个智能课程助手，帮助学生选择或管理他们的课程。请理解学生的自然语言输入并给出合适的响应。
 
-当前可用的课程信息：
-{json.dumps(self.courses, ensure_ascii=False, indent=2)}
+当前可用的课程信息（每行格式：课程名|类型|标签，多个标签用/分隔）：
+{self._courses_compact}
 
 学生已选课程：{list(self.selected_courses)}
 上次提到的课程：{self.last_mentioned_course}
@@ -306,7 +540,7 @@ class CourseSystem:
 6.在选课或退课时，根据上下文判断是否需要确认，并设置needs_confirmation。
 7.如果学生想查看已选课程，请返回show_selected动作。
 
-请返回以下JSON格式的响应，注意只返回JSON代码，不要任何额外内容，不要用代码块包裹：
+请返回以下JSON格式的响应：
 {{
     "action": "query/select/delete/show_selected",  # 查询、选课、退课或查看已选
     "filters": ["必修"/"选修"],      # 可选，课程类型过滤
@@ -318,13 +552,107 @@ class CourseSystem:
         "suggestions": [],           # 建议的操作
         "message": ""               # 返回给学生的信息
     }}
-}}
-
-只返回JSON代码！不要用代码块包裹！"""
+}}"""
+
+
+def _parse_choice(choice: str, count: int) -> Optional[int]:
+    """将用户输入的编号（1-count）转换为列表下标，无效输入返回 None"""
+    try:
+        index = int(choice)
+    except ValueError:
+        return None
+    return index - 1 if 1 <= index <= count else None
+
+
+def _handle_query(system: CourseSystem, parsed: dict):
+    results = system.query_courses(parsed.get("filters"), parsed.get("interests"))
+    if results:
+        print("\n根据您的兴趣，为您推荐以下课程:")
+        for course in results:
+            status = "已选" if course["name"] in system.selected_courses else "未选"
+            print(f"  - {course['name']} [{course['type']}] {status}")
+            print(f"    标签: {', '.join(course['tags'])}")
+
+        # 提示用户是否要选择课程
+        print("\n是否想选择以上推荐的课程？请输入课程编号进行选择，或输入 n 取消:")
+        choice = input("请选择(1-{0}): ".format(len(results)))
+        index = _parse_choice(choice, len(results))
+        if index is not None:
+            selected_course = results[index]["name"]
+            result = system.select_course(selected_course, force=True)
+            print(result["message"])
+    else:
+        print("抱歉，没有找到符合您兴趣的课程")
+
+
+def _handle_select(system: CourseSystem, parsed: dict):
+    if not parsed.get("course_name"):
+        print("请指定要选择的具体课程")
+        return
+    system._validate_strict(parsed["course_name"])
+
+    result = system.select_course(parsed["course_name"])
+    print(result["message"])
+
+    if result["needs_confirmation"]:
+        confirm = input("请确认是否选择该课程 (y/n): ")
+        if confirm.lower() == 'y':
+            final_result = system.select_course(result["course_to_confirm"], force=True)
+            print(final_result["message"])
+
+    elif result["similar_courses"]:
+        choice = input("请输入课程编号选择课程，或输入 n 取消: ")
+        index = _parse_choice(choice, len(result["similar_courses"]))
+        if index is not None:
+            selected_course = result["similar_courses"][index]
+            final_result = system.select_course(selected_course, force=True)
+            print(final_result["message"])
+
+
+def _handle_delete(system: CourseSystem, parsed: dict):
+    if not parsed.get("course_name"):
+        print("请指定要退选的具体课程")
+        return
+    system._validate_strict(parsed["course_name"])
+
+    result = system.delete_course(parsed["course_name"])
+    print(result["message"])
+
+    if result["needs_confirmation"]:
+        confirm = input("请确认是否退选该课程 (y/n): ")
+        if confirm.lower() == 'y':
+            final_result = system.delete_course(result["course_to_confirm"], force=True)
+            print(final_result["message"])
+
+    elif result["similar_courses"]:
+        choice = input("请输入课程编号选择要退选的课程，或输入 n 取消: ")
+        index = _parse_choice(choice, len(result["similar_courses"]))
+        if index is not None:
+            selected_course = result["similar_courses"][index]
+            final_result = system.delete_course(selected_course, force=True)
+            print(final_result["message"])
+
+
+def _handle_show(system: CourseSystem, parsed: dict):
+    results = system.show_selected_courses()
+    if isinstance(results, str):
+        print(results)
+    else:
+        print("\n您已选择的课程:")
+        for course in results:
+            print(f"  - {course['name']} [{course['type']}]")
+            print(f"    标签: {', '.join(course['tags'])}")
 
 
 def main():
     system = CourseSystem()
+    # 动作 -> 处理函数，未知动作直接忽略
+    handlers = {
+        Action.QUERY.value: _handle_query,
+        Action.SELECT.value: _handle_select,
+        Action.DELETE.value: _handle_delete,
+        Action.SHOW.value: _handle_show,
+    }
 
     while True:
         user_input = input('\n请输入您的需求(输入"退出"结束):')
@@ -340,76 +668,9 @@ def main():
             if parsed.get("context", {}).get("message"):
                 print(parsed["context"]["message"])
 
-            if parsed["action"] == Action.QUERY.value:
-                results = system.query_courses(parsed.get("filters"), parsed.get("interests"))
-                if results:
-                    print("\n根据您的兴趣，为您推荐以下课程:")
-                    for course in results:
-                        status = "已选" if course["name"] in system.selected_courses else "未选"
-                        print(f"  - {course['name']} [{course['type']}] {status}")
-                        print(f"    标签: {', '.join(course['tags'])}")
-
-                    # 提示用户是否要选择课程
-                    print("\n是否想选择以上推荐的课程？请输入课程编号进行选择，或输入 n 取消:")
-                    choice = input("请选择(1-{0}): ".format(len(results)))
-                    if choice.isdigit() and 1 <= int(choice) <= len(results):
-                        selected_course = results[int(choice) - 1]["name"]
-                        result = system.select_course(selected_course, force=True)
-                        print(result["message"])
-                else:
-                    print("抱歉，没有找到符合您兴趣的课程")
-
-            elif parsed["action"] == Action.SELECT.value:
-                if not parsed.get("course_name"):
-                    print("请指定要选择的具体课程")
-                    continue
-
-                result = system.select_course(parsed["course_name"])
-                print(result["message"])
-
-                if result["needs_confirmation"]:
-                    confirm = input("请确认是否选择该课程 (y/n): ")
-                    if confirm.lower() == 'y':
-                        final_result = system.select_course(result["course_to_confirm"], force=True)
-                        print(final_result["message"])
-
-                elif result["similar_courses"]:
-                    choice = input("请输入课程编号选择课程，或输入 n 取消: ")
-                    if choice.isdigit() and 1 <= int(choice) <= len(result["similar_courses"]):
-                        selected_course = result["similar_courses"][int(choice) - 1]
-                        final_result = system.select_course(selected_course, force=True)
-                        print(final_result["message"])
-
-            elif parsed["action"] == Action.DELETE.value:
-                if not parsed.get("course_name"):
-                    print("请指定要退选的具体课程")
-                    continue
-
-                result = system.delete_course(parsed["course_name"])
-                print(result["message"])
-
-                if result["needs_confirmation"]:
-                    confirm = input("请确认是否退选该课程 (y/n): ")
-                    if confirm.lower() == 'y':
-                        final_result = system.delete_course(result["course_to_confirm"], force=True)
-                        print(final_result["message"])
-
-                elif result["similar_courses"]:
-                    choice = input("请输入课程编号选择要退选的课程，或输入 n 取消: ")
-                    if choice.isdigit() and 1 <= int(choice) <= len(result["similar_courses"]):
-                        selected_course = result["similar_courses"][int(choice) - 1]
-                        final_result = system.delete_course(selected_course, force=True)
-                        print(final_result["message"])
-
-            elif parsed["action"] == Action.SHOW.value:
-                results = system.show_selected_courses()
-                if isinstance(results, str):
-                    print(results)
-                else:
-                    print("\n您已选择的课程:")
-                    for course in results:
-                        print(f"  - {course['name']} [{course['type']}]")
-                        print(f"    标签: {', '.join(course['tags'])}")
+            handler = handlers.get(parsed["action"])
+            if handler:
+                handler(system, parsed)
 
 
 if __name__ == "__main__":